@@ -1,137 +1,83 @@
 import streamlit as st
 import json, base64, io
+import numpy as np
 import pandas as pd
-import altair as alt
-from PIL import Image
-import qrcode
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Dict
 from urllib.parse import urlencode
 
-# ----------------------------- Styling (High-Contrast Cute Theme) -----------------------------
-APP_CSS = """
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Quicksand:wght@500;600;700&display=swap');
-    
-    html, body, [class*="css"] { 
-        font-family: 'Quicksand', sans-serif; 
-        color: #000000 !important; 
-    }
-    
-    /* Custom Button Styling */
-    .stButton > button {
-        background-color: #A8E6CF !important; /* Mint Green */
-        color: #000000 !important; /* Force black text */
-        border-radius: 25px !important;
-        border: none !important;
-        box-shadow: 0 4px 10px rgba(168, 230, 207, 0.4) !important;
-        font-weight: 700 !important;
-        transition: all 0.3s ease !important;
-    }
-    .stButton > button:hover {
-        background-color: #FFAAA5 !important; /* Soft Pink on hover */
-        box-shadow: 0 6px 14px rgba(255, 170, 165, 0.5) !important;
-        transform: translateY(-2px);
-    }
-    
-    /* Soft Cards for groupings */
-    .soft-card {
-        background: #ffffff; 
-        border: 2px solid #F6E7D8; 
-        border-radius: 24px;
-        padding: 20px; 
-        box-shadow: 0 10px 30px rgba(0,0,0,0.03);
-        margin-bottom: 20px;
-    }
-    
-    /* Cute pill badges */
-    .pill {
-        display: inline-block; padding: 6px 14px; border-radius: 20px;
-        background: #FFAAA5; color: #000000; font-weight: 700; font-size: 0.85rem;
-        box-shadow: 0 2px 5px rgba(255, 170, 165, 0.3);
-    }
-    
-    /* Live Total Badge */
-    .live-total-badge {
-        display: inline-block; padding: 8px 18px; border-radius: 20px;
-        background: #A8E6CF; color: #000000; font-weight: 700; font-size: 1rem;
-        box-shadow: 0 2px 5px rgba(168, 230, 207, 0.4);
-        border: 2px solid #000000;
-        margin-top: 10px;
-    }
-    
-    /* Text area styling - FORCED BLACK TEXT */
-    textarea[readonly], textarea[disabled], .stTextArea textarea { 
-        background-color: #F2EBE5 !important; 
-        border: 2px solid #F6E7D8 !important;
-        border-radius: 16px !important;
-        color: #000000 !important;
-        -webkit-text-fill-color: #000000 !important; 
-        font-weight: 700 !important;
-        font-size: 1.05rem !important;
-        opacity: 1 !important; 
-    }
-    
-    /* Inputs - Scoped to avoid weird phantom shapes */
-    .stTextInput input, .stNumberInput input {
-        border-radius: 12px !important;
-        color: #000000 !important;
-        font-weight: 600 !important;
-    }
-</style>
-"""
+from styles import APP_CSS
+
+try:
+    import pybase64 as b64
+except ImportError:  # fall back to the stdlib codec
+    b64 = base64
+
+try:
+    import orjson
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    json_loads = orjson.loads
+except ImportError:  # fall back to the stdlib encoder
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
 
 # ----------------------------- Serialization for Share Links -----------------------------
 def encode_state(d: dict) -> str:
-    raw = json.dumps(d, separators=(",", ":"), ensure_ascii=False)
-    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8")
+    raw = json_dumps(d)
+    return b64.urlsafe_b64encode(raw).decode("utf-8")
 
+@st.cache_data(show_spinner=False, max_entries=8)
 def decode_state(s: str) -> dict:
     try:
-        raw = base64.urlsafe_b64decode(s.encode("utf-8")).decode("utf-8")
-        return json.loads(raw)
+        return json_loads(b64.urlsafe_b64decode(s.encode("utf-8")))
     except Exception:
         return {}
 
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
 def build_share_link(base_url: str, state: dict) -> str:
     payload = encode_state(state)
     return f"{base_url}/?{urlencode({'state': payload})}"
 
-def qr_code_for_text(text: str) -> Image.Image:
-    qr = qrcode.QRCode(version=1, box_size=6, border=2)
-    qr.add_data(text)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="#000000", back_color="#FFFDF9").convert("RGB")
-    return img
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
+def qr_code_for_text(text: str) -> bytes:
+    import segno
+
+    qr = segno.make_qr(text, error="m")
+    buf = io.BytesIO()
+    qr.save(buf, kind="png", scale=6, border=2, dark="#000000", light="#FFFDF9")
+    return buf.getvalue()
 
 # ----------------------------- Core Settlement Logic -----------------------------
 def settle(balances: List[float], names: List[str]) -> str:
-    creditors = sorted([[i, bal] for i, bal in enumerate(balances) if bal > 0], key=lambda x: x[1], reverse=True)
-    debtors = sorted([[i, -bal] for i, bal in enumerate(balances) if bal < 0], key=lambda x: x[1], reverse=True)
-    
-    i = j = 0
-    lines = []
-    while i < len(debtors) and j < len(creditors):
-        d_idx, d_amt = debtors[i]
-        c_idx, c_amt = creditors[j]
-        pay_amt = min(d_amt, c_amt)
-        lines.append(f"✨ {names[d_idx]} pays ₹{pay_amt:.2f} to {names[c_idx]}")
-        debtors[i][1] -= pay_amt
-        creditors[j][1] -= pay_amt
-        if debtors[i][1] < 0.01: i += 1
-        if creditors[j][1] < 0.01: j += 1
+    from settle_core import settle_core
+
+    cents = np.rint(np.asarray(balances, dtype=np.float64) * 100).astype(np.int64)
+    creditors = np.flatnonzero(cents > 0)
+    creditors = creditors[np.argsort(-cents[creditors], kind="stable")]
+    debtors = np.flatnonzero(cents < 0)
+    debtors = debtors[np.argsort(cents[debtors], kind="stable")]
+
+    d_idx, c_idx, pay_cents = settle_core(cents, debtors, creditors)
+    lines = [f"✨ {names[d]} pays ₹{c // 100}.{c % 100:02d} to {names[cr]}" for d, cr, c in zip(d_idx.tolist(), c_idx.tolist(), pay_cents.tolist())]
     return "🤝 Settlements:\n" + ("\n".join(lines) if lines else "All settled! 🎉")
 
 def calc_with_equal_share(total_amount: float, paid: List[float], names: List[str]):
     n = len(names)
-    owed_each = [total_amount / n] * n
-    balances = [round(p - o, 2) for p, o in zip(paid, owed_each)]
-    return owed_each, balances
+    owed_each = np.full(n, total_amount / n)
+    balances = np.round(np.asarray(paid, dtype=np.float64) - owed_each, 2)
+    return owed_each.tolist(), balances.tolist()
 
 def calc_with_itemized(items: List[dict], paid: List[float], names: List[str]):
     n = len(names)
     idx = {name: i for i, name in enumerate(names)}
-    owed = [0.0] * n
+    flat_idx, flat_share = [], []
     total_amount = 0.0
     for it in items:
         amount = float(it["amount"])
@@ -139,22 +85,26 @@ def calc_with_itemized(items: List[dict], paid: List[float], names: List[str]):
         if amount <= 0 or not participants:
             continue
         total_amount += amount
-        share = amount / len(participants)
+        share = amount * (1.0 / len(participants))
         for person in participants:
-            if person in idx:
-                owed[idx[person]] += share
-    owed = [round(x, 2) for x in owed]
-    balances = [round(p - o, 2) for p, o in zip(paid, owed)]
-    return total_amount, owed, balances
+            i = idx.get(person)
+            if i is not None:
+                flat_idx.append(i)
+                flat_share.append(share)
+    owed = np.zeros(n)
+    np.add.at(owed, np.asarray(flat_idx, dtype=np.intp), np.asarray(flat_share, dtype=np.float64))
+    owed = np.round(owed, 2)
+    balances = np.round(np.asarray(paid, dtype=np.float64) - owed, 2)
+    return total_amount, owed.tolist(), balances.tolist()
 
 # ----------------------------- Data Models -----------------------------
-@dataclass
+@dataclass(slots=True)
 class Item:
     name: str
     amount: float
     participants: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     stage: int = 1
     people: int = 1
@@ -166,10 +116,13 @@ class AppState:
     owed: List[float] = None
     balances: List[float] = None
 
+def item_to_dict(x: Item) -> dict:
+    return {"name": x.name, "amount": x.amount, "participants": list(x.participants)}
+
 # ----------------------------- Groups Persistence -----------------------------
 def download_groups_button(groups: Dict[str, List[str]]):
     buf = io.BytesIO()
-    buf.write(json.dumps(groups, indent=2, ensure_ascii=False).encode("utf-8"))
+    buf.write(json_dumps(groups, indent=True))
     buf.seek(0)
     st.download_button("Download Groups 📥", data=buf, file_name="groups.json", mime="application/json")
 
@@ -177,7 +130,7 @@ def upload_groups_from_file():
     up = st.file_uploader("Upload Groups JSON", type=["json"], label_visibility="collapsed")
     if up:
         try:
-            loaded = json.loads(up.read().decode("utf-8"))
+            loaded = json_loads(up.read())
             if isinstance(loaded, dict):
                 st.session_state.groups.update(loaded)
                 st.success("Groups imported! 🌸")
@@ -187,62 +140,86 @@ def upload_groups_from_file():
             st.error(f"Invalid JSON: {e}")
 
 # ----------------------------- Charts -----------------------------
-def charts_df(names: List[str], paid: List[float], owed: List[float], balances: List[float]) -> pd.DataFrame:
-    df = pd.DataFrame({"Name": names, "Paid": paid, "Owed": owed, "Balance": balances})
+def charts_df(names: tuple, paid: tuple, owed: tuple, balances: tuple) -> pd.DataFrame:
+    df = pd.DataFrame({
+        "Name": np.asarray(names, dtype=object),
+        "Paid": np.asarray(paid, dtype=np.float64),
+        "Owed": np.asarray(owed, dtype=np.float64),
+        "Balance": np.asarray(balances, dtype=np.float64),
+    }, copy=False)
     return df
 
-def apply_chart_theme(chart):
-    return chart.configure_axis(
-        labelColor='#000000', titleColor='#000000', labelFontSize=12, titleFontSize=14
-    ).configure_title(
-        color='#000000', fontSize=16
-    ).configure_legend(
-        labelColor='#000000', titleColor='#000000', labelFontSize=12, titleFontSize=14
-    )
+_CHART_CONFIG = {
+    "axis": {"labelColor": "#000000", "titleColor": "#000000", "labelFontSize": 12, "titleFontSize": 14},
+    "title": {"color": "#000000", "fontSize": 16},
+    "legend": {"labelColor": "#000000", "titleColor": "#000000", "labelFontSize": 12, "titleFontSize": 14},
+}
+
+def _pie_spec(title: str, scheme: str) -> dict:
+    return {
+        "mark": {"type": "arc", "innerRadius": 40, "outerRadius": 110},
+        "encoding": {
+            "theta": {"field": "Value", "type": "quantitative"},
+            "color": {"field": "Name", "type": "nominal", "scale": {"scheme": scheme}},
+            "tooltip": [{"field": "Name", "type": "nominal"}, {"field": "Value", "type": "quantitative"}],
+        },
+        "height": 300,
+        "title": title,
+        "config": _CHART_CONFIG,
+    }
 
-def dual_pie_charts(df: pd.DataFrame):
+_PIE_PAID_SPEC = _pie_spec("Amount Paid (₹)", "pastel1")
+_PIE_OWED_SPEC = _pie_spec("Amount Owed (₹)", "pastel2")
+
+_BAR_NET_SPEC = {
+    "mark": {"type": "bar", "cornerRadiusTopLeft": 8, "cornerRadiusTopRight": 8},
+    "encoding": {
+        "x": {"field": "Name", "type": "nominal", "sort": None, "axis": {"labelAngle": 0}},
+        "y": {"field": "Balance", "type": "quantitative", "title": "Net Balance (₹)"},
+        "color": {"field": "Balance", "type": "quantitative", "scale": {"domain": [-1, 1], "range": ["#FFAAA5", "#A8E6CF"]}},
+    },
+    "height": 300,
+    "title": "Net Balance (Green = Receives, Pink = Pays)",
+    "config": _CHART_CONFIG,
+}
+
+def chart_values(names: tuple, values: tuple, field: str) -> List[dict]:
+    return [{"Name": n, field: v} for n, v in zip(names, values)]
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _spec_pie_paid(names: tuple, paid: tuple) -> dict:
+    return {**_PIE_PAID_SPEC, "data": {"values": chart_values(names, paid, "Value")}}
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _spec_pie_owed(names: tuple, owed: tuple) -> dict:
+    return {**_PIE_OWED_SPEC, "data": {"values": chart_values(names, owed, "Value")}}
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _spec_bar_net(names: tuple, balances: tuple) -> dict:
+    return {**_BAR_NET_SPEC, "data": {"values": chart_values(names, balances, "Balance")}}
+
+def dual_pie_charts(df: pd.DataFrame, names: tuple, paid: tuple, owed: tuple):
     """Creates side-by-side pie charts for Paid and Owed amounts."""
     col1, col2 = st.columns(2)
     
     with col1:
-        base_paid = pd.DataFrame({"Name": df["Name"], "Value": df["Paid"]})
-        if base_paid["Value"].sum() > 0:
-            chart_paid = (alt.Chart(base_paid)
-                         .mark_arc(innerRadius=40, outerRadius=110)
-                         .encode(
-                             theta="Value:Q", 
-                             color=alt.Color("Name:N", scale=alt.Scale(scheme="pastel1")), 
-                             tooltip=["Name", "Value"]
-                         )
-                         .properties(height=300, title="Amount Paid (₹)"))
-            st.altair_chart(apply_chart_theme(chart_paid), use_container_width=True)
+        if df["Paid"].sum() > 0:
+            st.vega_lite_chart(_spec_pie_paid(names, paid), use_container_width=True)
         else:
             st.info("No payments recorded.")
             
     with col2:
-        base_owed = pd.DataFrame({"Name": df["Name"], "Value": df["Owed"]})
-        if base_owed["Value"].sum() > 0:
-            chart_owed = (alt.Chart(base_owed)
-                         .mark_arc(innerRadius=40, outerRadius=110)
-                         .encode(
-                             theta="Value:Q", 
-                             color=alt.Color("Name:N", scale=alt.Scale(scheme="pastel2")), 
-                             tooltip=["Name", "Value"]
-                         )
-                         .properties(height=300, title="Amount Owed (₹)"))
-            st.altair_chart(apply_chart_theme(chart_owed), use_container_width=True)
-
-def bar_net_balance(df: pd.DataFrame):
-    chart = (alt.Chart(df)
-             .mark_bar(cornerRadiusTopLeft=8, cornerRadiusTopRight=8)
-             .encode(
-                 x=alt.X("Name:N", sort=None, axis=alt.Axis(labelAngle=0)), 
-                 y=alt.Y("Balance:Q", title="Net Balance (₹)"), 
-                 color=alt.Color("Balance:Q", scale=alt.Scale(domain=[-1, 1], range=["#FFAAA5", "#A8E6CF"]))
-             ).properties(height=300, title="Net Balance (Green = Receives, Pink = Pays)"))
-    st.altair_chart(apply_chart_theme(chart), use_container_width=True)
+        if df["Owed"].sum() > 0:
+            st.vega_lite_chart(_spec_pie_owed(names, owed), use_container_width=True)
+
+def bar_net_balance(names: tuple, balances: tuple):
+    st.vega_lite_chart(_spec_bar_net(names, balances), use_container_width=True)
 
 # ----------------------------- App -----------------------------
+def reset_people_editor():
+    st.session_state.pop("_people_base", None)
+    st.session_state.pop("people_editor", None)
+
 def main():
     st.set_page_config(page_title="Splitter Pro", page_icon="🍡", layout="centered", initial_sidebar_state="collapsed")
     st.markdown(APP_CSS, unsafe_allow_html=True)
@@ -263,15 +240,17 @@ def main():
         decoded = decode_state(q["state"])
         if decoded:
             app.names = decoded.get("names", [])
+            reset_people_editor()
             app.people = len(app.names) if app.names else 1
-            app.paid = decoded.get("paid", [0.0] * app.people)
+            # Pad/trim so the NumPy balance maths never sees mismatched lengths.
+            app.paid = (decoded.get("paid", []) + [0.0] * app.people)[:app.people]
             app.use_itemized = decoded.get("use_itemized", False)
             app.items = [Item(**i) for i in decoded.get("items", [])]
             app.amount = decoded.get("amount", 0.0)
             app.stage = decoded.get("stage", 2)
             if app.stage == 3 and (app.owed is None or app.balances is None):
                 if app.use_itemized:
-                    app.amount, app.owed, app.balances = calc_with_itemized([asdict(x) for x in app.items], app.paid, app.names)
+                    app.amount, app.owed, app.balances = calc_with_itemized([item_to_dict(x) for x in app.items], app.paid, app.names)
                 else:
                     app.owed, app.balances = calc_with_equal_share(float(app.amount), app.paid, app.names)
             st.rerun()
@@ -285,6 +264,7 @@ def main():
                 names = st.session_state.groups[chosen]
                 app.names = names
                 app.people = len(names)
+                reset_people_editor()
                 app.stage = 2
                 st.rerun()
 
@@ -336,19 +316,25 @@ def main():
         
         if not app.names or len(app.names) != app.people:
             app.names = [f"Friend {i+1}" for i in range(app.people)]
+            reset_people_editor()
         if not app.paid or len(app.paid) != app.people:
             app.paid = [0.0] * app.people
+            reset_people_editor()
         
-        name_cols = st.columns(3)
-        for i in range(app.people):
-            with name_cols[i % 3]:
-                app.names[i] = st.text_input(f"Name {i+1}", value=app.names[i], key=f"name_{i}")
-        
-        st.markdown("---")
-        paid_cols = st.columns(3)
-        for i in range(app.people):
-            with paid_cols[i % 3]:
-                app.paid[i] = st.number_input(f"{app.names[i]} paid (₹)", min_value=0.0, step=1.0, value=float(app.paid[i]), key=f"paid_{i}")
+        # The editor's id is derived from its data, so feed it a stable base frame and
+        # only rebuild it when the list is replaced or the widget state was cleared.
+        if "_people_base" not in st.session_state or "people_editor" not in st.session_state:
+            st.session_state._people_base = pd.DataFrame({"Name": app.names, "Paid": app.paid})
+        edited = st.data_editor(
+            st.session_state._people_base,
+            num_rows="fixed", hide_index=True, use_container_width=True, key="people_editor",
+            column_config={
+                "Name": st.column_config.TextColumn("Name", required=True),
+                "Paid": st.column_config.NumberColumn("Paid (₹)", min_value=0.0, step=1.0, format="%.2f"),
+            },
+        )
+        app.names = edited["Name"].fillna("").astype(str).tolist()
+        app.paid = edited["Paid"].fillna(0.0).astype(float).tolist()
         
         # --- NEW: Live Total Paid by Friends ---
         total_paid_by_friends = sum(app.paid)
@@ -388,7 +374,7 @@ def main():
                         st.rerun()
 
             if app.items:
-                st.dataframe(pd.DataFrame([asdict(i) for i in app.items]), use_container_width=True)
+                st.dataframe(pd.DataFrame([item_to_dict(i) for i in app.items]), use_container_width=True)
             st.markdown("</div>", unsafe_allow_html=True)
 
         nav_cols = st.columns(2)
@@ -398,13 +384,16 @@ def main():
                 st.rerun()
         with nav_cols[1]:
             if st.button("Calculate! 🪄", use_container_width=True):
-                if app.use_itemized:
-                    total_amount, owed, balances = calc_with_itemized([asdict(x) for x in app.items], app.paid, app.names)
-                    app.amount, app.owed, app.balances, app.stage = total_amount, owed, balances, 3
+                if not all(n.strip() for n in app.names):
+                    st.error("Please enter a name for everyone.")
                 else:
-                    app.owed, app.balances = calc_with_equal_share(float(app.amount), app.paid, app.names)
-                    app.stage = 3
-                st.rerun()
+                    if app.use_itemized:
+                        total_amount, owed, balances = calc_with_itemized([item_to_dict(x) for x in app.items], app.paid, app.names)
+                        app.amount, app.owed, app.balances, app.stage = total_amount, owed, balances, 3
+                    else:
+                        app.owed, app.balances = calc_with_equal_share(float(app.amount), app.paid, app.names)
+                        app.stage = 3
+                    st.rerun()
 
     # ---------------- Stage 3 ----------------
     if app.stage == 3:
@@ -415,21 +404,30 @@ def main():
         else:
             st.markdown(f"**Equal share per person:** ₹{(app.amount / max(1, app.people)):.2f}")
 
-        summary_lines = []
-        for name, paid, owed, bal in zip(app.names, app.paid, app.owed, app.balances):
-            status = "receives" if bal > 0 else "pays" if bal < 0 else "is settled"
-            summary_lines.append(f"• {name} paid ₹{paid:.2f} | owed ₹{owed:.2f} → {status} ₹{abs(bal):.2f}")
+        fp = (tuple(app.names), tuple(app.paid), tuple(app.owed), tuple(app.balances))
+        if st.session_state.get("_stage3_fp") == fp:
+            summary_text, settlements_text, df = st.session_state._stage3_cache
+        else:
+            summary_lines = []
+            for name, paid, owed, bal in zip(app.names, app.paid, app.owed, app.balances):
+                status = "receives" if bal > 0 else "pays" if bal < 0 else "is settled"
+                summary_lines.append(f"• {name} paid ₹{paid:.2f} | owed ₹{owed:.2f} → {status} ₹{abs(bal):.2f}")
+            summary_text = "\n".join(summary_lines)
+            settlements_text = settle(app.balances, app.names)
+            df = charts_df(*fp)
+            st.session_state._stage3_fp = fp
+            st.session_state._stage3_cache = (summary_text, settlements_text, df)
         
-        st.text_area("Summary", value="\n".join(summary_lines) + "\n\n" + settle(app.balances, app.names), height=250, disabled=True)
+        st.text_area("Summary", value=summary_text + "\n\n" + settlements_text, height=250, disabled=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
         st.markdown("#### 📊 Visual Summary")
-        df = charts_df(app.names, app.paid, app.owed, app.balances)
         
         # --- NEW: Side-by-Side Pie Charts for Paid and Owed ---
-        dual_pie_charts(df) 
+        names, paid, owed, balances = fp
+        dual_pie_charts(df, names, paid, owed)
         
-        bar_net_balance(df)
+        bar_net_balance(names, balances)
 
         st.markdown("<div class='soft-card'>", unsafe_allow_html=True)
         st.markdown("#### 📲 Share with Friends")
@@ -439,18 +437,16 @@ def main():
         if st.button("Generate Magic Link & QR 🪄", use_container_width=True):
             share_state = {
                 "stage": 3, "names": app.names, "paid": app.paid,
-                "items": [asdict(x) for x in (app.items or [])],
+                "items": [item_to_dict(x) for x in (app.items or [])],
                 "use_itemized": app.use_itemized, "amount": app.amount,
             }
             link = build_share_link(base_url, share_state)
             st.code(link, language="text")
             
-            qr_img = qr_code_for_text(link)
-            qr_buffer = io.BytesIO()
-            qr_img.save(qr_buffer, format="PNG")
+            qr_bytes = qr_code_for_text(link)
             
-            st.image(qr_img, caption="Scan to see results!", width=200)
-            st.download_button("Download QR 📱", data=qr_buffer.getvalue(), file_name="split_qr.png", mime="image/png")
+            st.image(qr_bytes, caption="Scan to see results!", width=200)
+            st.download_button("Download QR 📱", data=qr_bytes, file_name="split_qr.png", mime="image/png")
         st.markdown("</div>", unsafe_allow_html=True)
 
         cols = st.columns(2)
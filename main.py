@@ -138,29 +138,23 @@ class ExpenseSplitterApp:
         equal_share = self.total_amount / self.total_people
         balances = [round(paid - equal_share, 2) for paid in contributions]
 
-        creditors = [[i, bal] for i, bal in enumerate(balances) if bal > 0]
-        debtors = [[i, -bal] for i, bal in enumerate(balances) if bal < 0]
+        cents = [round(bal * 100) for bal in balances]
+        creditors = [[i, c] for i, c in enumerate(cents) if c > 0]
+        debtors = [[i, -c] for i, c in enumerate(cents) if c < 0]
 
         self.result_text.delete("1.0", tk.END)
-        self.result_text.insert(tk.END, f"💰 Equal share per person: ₹{equal_share:.2f}\n\n")
-        self.result_text.insert(tk.END, "📄 Summary:\n")
+        parts = [f"💰 Equal share per person: ₹{equal_share:.2f}\n\n", "📄 Summary:\n"]
         for i in range(self.total_people):
             status = "receives" if balances[i] > 0 else "pays" if balances[i] < 0 else "is settled"
-            self.result_text.insert(
-                tk.END,
-                f"• {names[i]} paid ₹{contributions[i]:.2f} → {status} ₹{abs(balances[i]):.2f}\n"
-            )
+            parts.append(f"• {names[i]} paid ₹{contributions[i]:.2f} → {status} ₹{abs(balances[i]):.2f}\n")
 
-        self.result_text.insert(tk.END, "\n🤝 Settlements:\n")
+        parts.append("\n🤝 Settlements:\n")
         i = j = 0
         while i < len(debtors) and j < len(creditors):
             d_idx, d_amt = debtors[i]
             c_idx, c_amt = creditors[j]
             pay_amt = min(d_amt, c_amt)
-            self.result_text.insert(
-                tk.END,
-                f"→ {names[d_idx]} pays ₹{pay_amt:.2f} to {names[c_idx]}\n"
-            )
+            parts.append(f"→ {names[d_idx]} pays ₹{pay_amt // 100}.{pay_amt % 100:02d} to {names[c_idx]}\n")
             debtors[i][1] -= pay_amt
             creditors[j][1] -= pay_amt
             if debtors[i][1] == 0:
@@ -168,6 +162,8 @@ class ExpenseSplitterApp:
             if creditors[j][1] == 0:
                 j += 1
 
+        self.result_text.insert(tk.END, "".join(parts))
+
 
 # Launch the app
 if __name__ == "__main__":
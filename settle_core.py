@@ -0,0 +1,30 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the settlement core as plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+
+# Lives outside app1.py so the compiled dispatcher survives Streamlit reruns.
+@njit(cache=True, nogil=True)
+def settle_core(cents, debtors, creditors):
+    n = cents.shape[0]
+    out_d = np.empty(n, np.int64)
+    out_c = np.empty(n, np.int64)
+    out_amt = np.empty(n, np.int64)
+    d_left = -cents[debtors]
+    c_left = cents[creditors]
+    i = j = k = 0
+    while i < debtors.shape[0] and j < creditors.shape[0]:
+        pay = min(d_left[i], c_left[j])
+        out_d[k] = debtors[i]
+        out_c[k] = creditors[j]
+        out_amt[k] = pay
+        k += 1
+        d_left[i] -= pay
+        c_left[j] -= pay
+        if d_left[i] == 0: i += 1
+        if c_left[j] == 0: j += 1
+    return out_d[:k], out_c[:k], out_amt[:k]
@@ -0,0 +1,76 @@
+import re
+
+# ----------------------------- Styling (High-Contrast Cute Theme) -----------------------------
+# Kept out of app1.py so the minification runs once per process, not on every rerun.
+APP_CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Quicksand:wght@500;600;700&display=swap');
+    
+    html, body, [class*="css"] { 
+        font-family: 'Quicksand', sans-serif; 
+        color: #000000 !important; 
+    }
+    
+    /* Custom Button Styling */
+    .stButton > button {
+        background-color: #A8E6CF !important; /* Mint Green */
+        color: #000000 !important; /* Force black text */
+        border-radius: 25px !important;
+        border: none !important;
+        box-shadow: 0 4px 10px rgba(168, 230, 207, 0.4) !important;
+        font-weight: 700 !important;
+        transition: all 0.3s ease !important;
+    }
+    .stButton > button:hover {
+        background-color: #FFAAA5 !important; /* Soft Pink on hover */
+        box-shadow: 0 6px 14px rgba(255, 170, 165, 0.5) !important;
+        transform: translateY(-2px);
+    }
+    
+    /* Soft Cards for groupings */
+    .soft-card {
+        background: #ffffff; 
+        border: 2px solid #F6E7D8; 
+        border-radius: 24px;
+        padding: 20px; 
+        box-shadow: 0 10px 30px rgba(0,0,0,0.03);
+        margin-bottom: 20px;
+    }
+    
+    /* Cute pill badges */
+    .pill {
+        display: inline-block; padding: 6px 14px; border-radius: 20px;
+        background: #FFAAA5; color: #000000; font-weight: 700; font-size: 0.85rem;
+        box-shadow: 0 2px 5px rgba(255, 170, 165, 0.3);
+    }
+    
+    /* Live Total Badge */
+    .live-total-badge {
+        display: inline-block; padding: 8px 18px; border-radius: 20px;
+        background: #A8E6CF; color: #000000; font-weight: 700; font-size: 1rem;
+        box-shadow: 0 2px 5px rgba(168, 230, 207, 0.4);
+        border: 2px solid #000000;
+        margin-top: 10px;
+    }
+    
+    /* Text area styling - FORCED BLACK TEXT */
+    textarea[readonly], textarea[disabled], .stTextArea textarea { 
+        background-color: #F2EBE5 !important; 
+        border: 2px solid #F6E7D8 !important;
+        border-radius: 16px !important;
+        color: #000000 !important;
+        -webkit-text-fill-color: #000000 !important; 
+        font-weight: 700 !important;
+        font-size: 1.05rem !important;
+        opacity: 1 !important; 
+    }
+    
+    /* Inputs - Scoped to avoid weird phantom shapes */
+    .stTextInput input, .stNumberInput input {
+        border-radius: 12px !important;
+        color: #000000 !important;
+        font-weight: 600 !important;
+    }
+</style>
+"""
+APP_CSS = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", APP_CSS, flags=re.S)).strip()